@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Async Voice Harbor pipeline built on httpx.
+
+This module provides asyncio counterparts to the upload/wait/download hot paths of
+VoiceHarborClient. A single httpx.AsyncClient (HTTP/2 when the 'h2' package is
+installed) carries the signed-URL requests, the PUT uploads, the finalized polls
+and the GET downloads, so TLS handshakes and connections are shared across every
+file instead of one blocking thread per transfer.
+
+httpx and aiofiles are optional dependencies (install the 'async' extra); the
+synchronous client falls back to its thread-pool implementation when they are
+missing.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import random
+import time
+from pathlib import Path
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+logger = logging.getLogger(__name__)
+
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_CHUNK_SIZE = 1024 * 1024
+
+
+def _make_client(concurrency: int = 16, timeout: tuple = (5, 60)) -> "httpx.AsyncClient":
+    """
+    Build the shared AsyncClient, sized like the sync adapter.
+
+    Args:
+        concurrency (int, optional): Number of parallel transfers; the connection
+            pool is sized to twice this. Defaults to 16.
+        timeout (tuple, optional): (connect, read) timeout in seconds. Defaults to (5, 60).
+    """
+    return httpx.AsyncClient(
+        http2=_HTTP2,
+        limits=httpx.Limits(max_connections=2 * concurrency,
+                            max_keepalive_connections=concurrency),
+        timeout=httpx.Timeout(timeout[1], connect=timeout[0]),
+    )
+
+
+async def _file_chunks(file_path: Path):
+    """Yield a file's contents in chunks without blocking the event loop."""
+    if aiofiles is not None:
+        async with aiofiles.open(file_path, "rb") as f:
+            while chunk := await f.read(_CHUNK_SIZE):
+                yield chunk
+    else:
+        with open(file_path, "rb", buffering=_CHUNK_SIZE) as f:
+            while chunk := await asyncio.to_thread(f.read, _CHUNK_SIZE):
+                yield chunk
+
+
+async def submit_one(client: "httpx.AsyncClient", base_url: str, job_id: str,
+                     headers: dict, file_path: Path, mime_type: str) -> str:
+    """
+    Upload a single file: request its signed URL, then stream the PUT.
+
+    Returns:
+        str: The name of the uploaded file.
+    """
+    endpoint = f"{base_url}/api/jobs/{job_id}/files/upload-url"
+    payload = {"fileName": file_path.name, "fileType": mime_type}
+    response = await client.post(endpoint, json=payload, headers=headers)
+    response.raise_for_status()
+    signed_url = response.json()["signedUrl"]
+    put_headers = {
+        "Content-Type": mime_type,
+        "Content-Length": str(file_path.stat().st_size),
+    }
+    response = await client.put(signed_url, content=_file_chunks(file_path), headers=put_headers)
+    response.raise_for_status()
+    return file_path.name
+
+
+async def submit_all(base_url: str, job_id: str, token: str, files: list,
+                     mime_for: "callable", concurrency: int = 16,
+                     timeout: tuple = (5, 60)) -> list:
+    """
+    Upload all files concurrently over one shared client.
+
+    Args:
+        base_url (str): The base URL for the Voice Harbor API.
+        job_id (str): The job identifier.
+        token (str): Authorization token for API access.
+        files (list): Path objects to upload.
+        mime_for (callable): Maps a Path to its MIME type string.
+        concurrency (int, optional): Number of parallel transfers. Defaults to 16.
+        timeout (tuple, optional): (connect, read) timeout in seconds. Defaults to (5, 60).
+
+    Returns:
+        list: Names of the files that uploaded successfully, in input order.
+    """
+    headers = {"Authorization": token} if token else {}
+    uploaded = []
+    async with _make_client(concurrency, timeout) as client:
+        tasks = [
+            submit_one(client, base_url, job_id, headers, Path(f), mime_for(Path(f)))
+            for f in files
+        ]
+        for file_path, result in zip(files, await asyncio.gather(*tasks, return_exceptions=True)):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to upload {Path(file_path).name}: {result}")
+            else:
+                uploaded.append(result)
+    return uploaded
+
+
+async def wait_for_file(client: "httpx.AsyncClient", base_url: str, job_id: str,
+                        headers: dict, file_name: str, timeout: int = 600,
+                        min_interval: float = 2, max_interval: float = 30,
+                        rate: float = 1.5) -> bool:
+    """Async counterpart of VoiceHarborClient.wait_for_file with the same backoff."""
+    endpoint = f"{base_url}/api/jobs/{job_id}/files/finalized"
+    start_time = time.time()
+    delay = min_interval
+    while time.time() - start_time < timeout:
+        try:
+            response = await client.post(endpoint, json={"fileName": file_name}, headers=headers)
+            response.raise_for_status()
+            if response.json().get("exists", False):
+                return True
+        except Exception as e:
+            logger.info(f"Error checking file existence for {file_name}: {e}")
+        delay = min(max_interval, delay * rate)
+        await asyncio.sleep(random.uniform(min_interval, delay))
+    logger.error(f"Timeout reached: {file_name} not available after {timeout} seconds.")
+    return False
+
+
+async def download_file(client: "httpx.AsyncClient", base_url: str, job_id: str,
+                        headers: dict, file_name: str, dest_dir: Path) -> Path:
+    """Fetch a finalized file's signed URL and stream it to dest_dir."""
+    endpoint = f"{base_url}/api/jobs/{job_id}/files/download-url"
+    response = await client.post(endpoint, json={"fileName": file_name}, headers=headers)
+    response.raise_for_status()
+    signed_url = response.json()["signedUrl"]
+    dest_path = Path(dest_dir) / file_name
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    async with client.stream("GET", signed_url) as stream:
+        stream.raise_for_status()
+        with dest_path.open("wb") as f:
+            async for chunk in stream.aiter_bytes(_CHUNK_SIZE):
+                f.write(chunk)
+    logger.info(f"Downloaded {file_name} to {dest_path}")
+    return dest_path
+
+
+def run_submit_all(base_url: str, job_id: str, token: str, files: list,
+                   mime_for: "callable", concurrency: int = 16,
+                   timeout: tuple = (5, 60)) -> list:
+    """Synchronous entry point: run submit_all on a fresh event loop."""
+    return asyncio.run(submit_all(base_url, job_id, token, files, mime_for,
+                                  concurrency, timeout))
@@ -17,9 +17,31 @@ Usage:
 """
 
 import requests
+import urllib3
 import yaml
+
+# Prefer the libyaml C implementations; they are ~5-10x faster on large specs
+# and shipped in the manylinux pyyaml wheels.
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
+import atexit
+import functools
+import gzip
+import hashlib
+import http.server
+import json
 import mimetypes
 import logging
+import logging.handlers
+import os
+import queue
+import random
+import socket
+import sys
+import threading
 import time  # For sleep delays
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -27,18 +49,156 @@ import tqdm
 import argparse
 import datetime
 
-# Configure logging
+try:
+    import aio  # Optional asyncio/httpx pipeline for the upload hot path.
+except ImportError:
+    aio = None
+
+# orjson decodes large API responses 2-6x faster than the stdlib; fall back to
+# json on platforms without a prebuilt wheel.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Configure logging: records go through a queue to a background listener, so
+# worker threads never block on log I/O while holding the GIL.
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(
+    "%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+))
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# The queue side passes the raw message through; the listener's handler does
+# the real formatting.
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
+    handlers=[_queue_handler],
 )
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Progress bars are only useful on an interactive terminal; under CI they just
+# mangle the log output.
+_USE_TQDM = sys.stderr.isatty()
+# Emit one aggregated progress line per this many completions when not on a TTY.
+_LOG_EVERY = 32
+
 # Define supported file formats (PDF removed).
 SUPPORTED_FORMATS = {'.wav', '.mp3', '.flac', '.ogg', '.m4a', '.yaml'}
+# Same extensions without the leading dot, matching str.rpartition('.') output.
+_SUPPORTED_EXT_NOSUFFIX = frozenset(ext.lstrip('.') for ext in SUPPORTED_FORMATS)
 VERSION = "0.45.1"
 
+
+@functools.lru_cache(maxsize=64)
+def _mime_for_suffix(suffix: str) -> str:
+    """
+    Resolve a MIME type from a (lowercased) file suffix, cached per extension.
+
+    mimetypes.guess_type walks its type maps on every call; with only a handful of
+    supported extensions the answer is the same for every file that shares one.
+
+    Args:
+        suffix (str): The file suffix including the leading dot, e.g. ".wav".
+
+    Returns:
+        str: The guessed MIME type, or "application/octet-stream" if unknown.
+    """
+    file_type, _ = mimetypes.guess_type(f"x{suffix}")
+    return file_type or "application/octet-stream"
+
+
+def _sha256_of(file_path: Path) -> str:
+    """
+    Compute the streaming SHA-256 digest of a file.
+
+    Uses hashlib.file_digest (Python 3.11+), which hashes in the C layer without
+    holding the GIL; older interpreters fall back to a chunked read loop.
+
+    Args:
+        file_path (Path): The path to the file to hash.
+
+    Returns:
+        str: The hex-encoded SHA-256 digest.
+    """
+    with open(file_path, "rb", buffering=1024 * 1024) as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def _build_adapter(pool_maxsize: int = 32) -> requests.adapters.HTTPAdapter:
+    """
+    Build an HTTPAdapter sized for the client's thread pools.
+
+    The pool is large enough for the upload/download executors plus waiter threads
+    (the default pool_maxsize of 10 gets exhausted once both run concurrently),
+    pool_block avoids throwaway connections when the pool is full, and transient
+    server/ratelimit errors are retried with backoff.
+
+    Args:
+        pool_maxsize (int, optional): Maximum connections per host pool. Defaults to 32.
+
+    Returns:
+        requests.adapters.HTTPAdapter: A configured adapter to mount on a session.
+    """
+    return requests.adapters.HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=pool_maxsize,
+        pool_block=True,
+        max_retries=urllib3.Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "PUT", "POST"]),
+        ),
+    )
+
+
+# Default (connect, read) timeout for API calls; a hung server must not park a
+# worker thread in recv() forever, stealing a pool slot.
+_TIMEOUT = (5, 60)
+# Per-read stall guard for streamed downloads: urllib3 applies the read timeout
+# to each socket read, so transfers that stop producing bytes get aborted
+# without capping the total duration of large downloads.
+_STALL_TIMEOUT = 30
+
+# Advertise zstd only when the decoder is importable (urllib3 uses it to
+# decompress transparently); gzip support is always built in.
+try:
+    import zstandard  # noqa: F401
+    _ACCEPT_ENCODING = "zstd, gzip"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip"
+
+# Uploads at or below this size skip the requests machinery (PreparedRequest,
+# hooks, cookie-jar merge) and go straight through urllib3.
+_SMALL_UPLOAD_LIMIT = 8 * 1024 * 1024
+_POOL = urllib3.PoolManager(
+    num_pools=16,
+    maxsize=32,
+    block=True,
+    retries=urllib3.Retry(3, backoff_factor=0.5),
+    timeout=urllib3.Timeout(connect=_TIMEOUT[0], read=_TIMEOUT[1]),
+)
+
+# Shared session for the job/admin classmethods, so TCP+TLS setup is amortized
+# across calls instead of paid on every bare requests.post/get.
+_SESSION = requests.Session()
+_adapter = _build_adapter()
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+del _adapter
+
 class VoiceHarborClient:
     """
     A Python client for the Voice Harbor service.
@@ -55,7 +215,9 @@ class VoiceHarborClient:
         input_files (list): List of input files (Path objects) from the given directory.
     """
 
-    def __init__(self, base_url: str, job_id: str, token: str = "", inputs_dir: str = "") -> None:
+    def __init__(self, base_url: str, job_id: str, token: str = "", inputs_dir: str = "",
+                 request_timeout: tuple = _TIMEOUT, concurrency: int = 5,
+                 use_async: bool = False) -> None:
         """
         Initialize the VoiceHarborClient instance.
 
@@ -64,12 +226,30 @@ class VoiceHarborClient:
             job_id (str): The job identifier.
             token (str, optional): Authorization token for API access. Defaults to "".
             inputs_dir (str, optional): Directory path containing files to be uploaded. Defaults to "".
+            request_timeout (tuple, optional): (connect, read) timeout in seconds applied to
+                every API request. Defaults to (5, 60).
+            concurrency (int, optional): Number of parallel transfers; also sizes the
+                HTTP connection pool. Defaults to 5.
+            use_async (bool, optional): Upload through the asyncio/httpx pipeline
+                (requires the 'async' extra) instead of the thread pool. Defaults to False.
         """
         self.base_url = base_url.rstrip("/")
+        self.concurrency = concurrency
+        self.use_async = use_async
         self.session = requests.Session()
+        adapter = _build_adapter(pool_maxsize=max(32, 2 * concurrency))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Result JSON/YAML is highly compressible; responses are decompressed
+        # transparently by urllib3.
+        self.session.headers.update({"Accept-Encoding": _ACCEPT_ENCODING})
+        self._timeout = request_timeout
         self.id_token = token
+        self._auth_headers = {"Authorization": token} if token else {}
+        self._json_headers = {**self._auth_headers, "Content-Type": "application/json"}
         self.job_id = job_id
         self.input_files = self.parse_files(Path(inputs_dir))
+        self._webhook_events = {}
 
     @classmethod
     def create_job(cls, base_url: str, token: str) -> str:
@@ -88,9 +268,9 @@ class VoiceHarborClient:
         """
         endpoint = f"{base_url}/api/jobs"
         headers = {"Authorization": token} if token else {}
-        response = requests.post(endpoint, headers=headers)
+        response = _SESSION.post(endpoint, headers=headers, timeout=_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
         logger.info(f"Created job with id: {data['job_id']}")
         return data["job_id"]
     
@@ -104,9 +284,9 @@ class VoiceHarborClient:
         """
         endpoint = f"{base_url}/api/jobs"
         headers = {"Authorization": token} if token else {}
-        response = requests.get(endpoint, headers=headers)
+        response = _SESSION.get(endpoint, headers=headers, timeout=_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
         logger.info(f"Retrieved jobs: {data}")
         return data.get("jobs", [])
 
@@ -121,9 +301,9 @@ class VoiceHarborClient:
         """
         endpoint = f"{base_url}/api/jobs/{job_id}/content"
         headers = {"Authorization": token} if token else {}
-        response = requests.get(endpoint, headers=headers)
+        response = _SESSION.get(endpoint, headers=headers, timeout=_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
         logger.info(f"Retrieved job content: {data}")
         return data.get("jobContent", [])
 
@@ -141,9 +321,9 @@ class VoiceHarborClient:
         """
         endpoint = f"{base_url}/api/admin/developer-token"
         headers = {"Authorization": f"Bearer {admin_token}"}
-        response = requests.post(endpoint, headers=headers)
+        response = _SESSION.post(endpoint, headers=headers, timeout=_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
         logger.info(f"Received developer token: {data}")
         developer_token = data.get("developerToken", "")
         
@@ -153,8 +333,16 @@ class VoiceHarborClient:
         filename = f"VoiceHarbor_Developer.credential.{timestamp}.yaml"
         filepath = credentials_dir / filename
         logger.info(f"Received developer token stored below: {filepath}.")
-        filepath.write_text(yaml.safe_dump({"developerToken": developer_token}))
-        
+        # Write via a temp file + rename so a crash mid-write never leaves a
+        # truncated credential behind. The file is created owner-only from the
+        # start; chmod-after-write would leave a window where the secret is
+        # readable at the umask default.
+        tmp = filepath.with_suffix(filepath.suffix + ".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(yaml.dump({"developerToken": developer_token}, Dumper=_YamlDumper).encode())
+        os.replace(tmp, filepath)
+
         return str(filepath)
 
     @classmethod
@@ -170,9 +358,9 @@ class VoiceHarborClient:
         """
         endpoint = f"{base_url}/api/admin/developer-tokens"
         headers = {"Authorization": f"Bearer {admin_token}"}
-        response = requests.get(endpoint, headers=headers)
+        response = _SESSION.get(endpoint, headers=headers, timeout=_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
         logger.info(f"Retrieved developer tokens: {data}")
         return data.get("developerTokens", [])
         
@@ -186,10 +374,17 @@ class VoiceHarborClient:
         Returns:
             list: A list of Path objects for files that match the supported formats.
         """
-        files = [
-            file_path for file_path in inputs_dir.iterdir()
-            if file_path.is_file() and file_path.suffix.lower() in SUPPORTED_FORMATS
-        ]
+        # os.scandir answers is_file() from the readdir d_type, avoiding one
+        # stat() syscall per entry that Path.iterdir + is_file() would pay.
+        # The '.' guard mirrors Path.suffix semantics: names without an extension
+        # and bare dotfiles like ".wav" have no suffix and are skipped.
+        with os.scandir(inputs_dir) as it:
+            files = [
+                Path(entry.path) for entry in it
+                if entry.is_file(follow_symlinks=False)
+                and '.' in entry.name[1:]
+                and entry.name.rpartition('.')[2].lower() in _SUPPORTED_EXT_NOSUFFIX
+            ]
         logger.info(f"Found {len(files)} files to upload.")
         return files
 
@@ -201,8 +396,10 @@ class VoiceHarborClient:
             token (str): The new authorization token.
         """
         self.id_token = token
+        self._auth_headers = {"Authorization": token} if token else {}
+        self._json_headers = {**self._auth_headers, "Content-Type": "application/json"}
 
-    def get_signed_url(self, file_name: str, file_type: str) -> str:
+    def get_signed_url(self, file_name: str, file_type: str, sha256: str = None) -> str:
         """
         Request a signed URL from the server for uploading a file.
 
@@ -211,20 +408,69 @@ class VoiceHarborClient:
         Args:
             file_name (str): The name of the file to be uploaded.
             file_type (str): The MIME type of the file.
+            sha256 (str, optional): Hex digest of the file content, letting the server
+                deduplicate already-stored uploads. Defaults to None.
 
         Returns:
             str: The signed URL for file upload.
 
+        Raises:
+            requests.HTTPError: If the HTTP request returned an unsuccessful status code.
+        """
+        return self._upload_url_response(file_name, file_type, sha256)["signedUrl"]
+
+    def _upload_url_response(self, file_name: str, file_type: str, sha256: str = None) -> dict:
+        """
+        POST /files/upload-url and return the full response payload.
+
+        Besides "signedUrl", servers that support content dedup may answer with
+        "alreadyUploaded": true when the sha256 matches stored content.
+
+        Args:
+            file_name (str): The name of the file to be uploaded.
+            file_type (str): The MIME type of the file.
+            sha256 (str, optional): Hex digest of the file content. Defaults to None.
+
+        Returns:
+            dict: The decoded JSON response.
+
         Raises:
             requests.HTTPError: If the HTTP request returned an unsuccessful status code.
         """
         endpoint = f"{self.base_url}/api/jobs/{self.job_id}/files/upload-url"
-        headers = {"Authorization": self.id_token} if self.id_token else {}
         payload = {"fileName": file_name, "fileType": file_type}
-        response = self.session.post(endpoint, json=payload, headers=headers)
+        if sha256:
+            payload["sha256"] = sha256
+        response = self.session.post(endpoint, json=payload, headers=self._auth_headers, timeout=self._timeout)
         response.raise_for_status()
-        data = response.json()
-        return data["signedUrl"]
+        return _json_loads(response.content)
+
+    def get_signed_urls_bulk(self, file_specs: list) -> dict:
+        """
+        Request signed upload URLs for many files in a single round-trip.
+
+        Collapses the per-file POST /files/upload-url latency into one request, so
+        the upload phase is bandwidth-bound rather than RTT-bound on large batches.
+
+        Args:
+            file_specs (list): Dicts with "fileName" and "fileType" keys, one per file.
+
+        Returns:
+            dict: A mapping of file name to signed URL. Empty if the server does not
+                implement the bulk endpoint, so callers can fall back to per-file requests.
+
+        Raises:
+            requests.HTTPError: If the request fails for any reason other than the
+                endpoint being unimplemented (404/405).
+        """
+        endpoint = f"{self.base_url}/api/jobs/{self.job_id}/files/upload-urls"
+        response = self.session.post(endpoint, json={"files": file_specs}, headers=self._auth_headers, timeout=self._timeout)
+        if response.status_code in (404, 405):
+            logger.info("Bulk upload-url endpoint unavailable; falling back to per-file requests.")
+            return {}
+        response.raise_for_status()
+        data = _json_loads(response.content)
+        return data.get("signedUrls", {})
 
     def submit_file(self, file_path: Path) -> str:
         """
@@ -242,15 +488,49 @@ class VoiceHarborClient:
             requests.HTTPError: If any HTTP request fails.
         """
         file_path = Path(file_path)
-        file_type, _ = mimetypes.guess_type(str(file_path))
-        filename = file_path.name
-        mime_type = file_type or "application/octet-stream"
-        signed_url = self.get_signed_url(filename, mime_type)
-        headers = {"Content-Type": mime_type}
-        with file_path.open("rb") as f:
-            resp = self.session.put(signed_url, data=f, headers=headers)
+        mime_type = _mime_for_suffix(file_path.suffix.lower())
+        # Offer the content hash so the server can short-circuit re-uploads of
+        # files it already stores under this token/job.
+        data = self._upload_url_response(file_path.name, mime_type, sha256=_sha256_of(file_path))
+        if data.get("alreadyUploaded", False):
+            logger.info(f"Skipping upload of {file_path.name}: content already stored.")
+            return file_path.name
+        return self._put_file(file_path, data["signedUrl"], mime_type)
+
+    def _put_file(self, file_path: Path, signed_url: str, mime_type: str) -> str:
+        """
+        PUT a file to an already-obtained signed URL.
+
+        Args:
+            file_path (Path): The path to the file that will be uploaded.
+            signed_url (str): The signed URL to upload to.
+            mime_type (str): The MIME type of the file.
+
+        Returns:
+            str: The name of the file that was uploaded.
+
+        Raises:
+            requests.HTTPError: If the upload request fails.
+        """
+        size = file_path.stat().st_size
+        # An explicit Content-Length keeps urllib3 from falling back to chunked
+        # transfer encoding, which some signed-URL storage backends reject.
+        headers = {
+            "Content-Type": mime_type,
+            "Content-Length": str(size),
+        }
+        if size <= _SMALL_UPLOAD_LIMIT:
+            # Small files go straight through the urllib3 pool, skipping the
+            # per-request object construction requests performs.
+            resp = _POOL.request("PUT", signed_url, body=file_path.read_bytes(), headers=headers)
+            if resp.status >= 400:
+                raise requests.HTTPError(
+                    f"Upload of {file_path.name} failed with status {resp.status}")
+            return file_path.name
+        with open(file_path, "rb", buffering=1024 * 1024) as f:
+            resp = self.session.put(signed_url, data=f, headers=headers, timeout=self._timeout)
             resp.raise_for_status()
-        return filename
+        return file_path.name
 
     def submit_files(self, job_params: dict) -> dict:
         """
@@ -265,34 +545,86 @@ class VoiceHarborClient:
         Returns:
             dict: The updated job_params dictionary with uploaded file names included.
         """
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_file = {executor.submit(self.submit_file, file): file for file in self.input_files}
-            for future in tqdm.tqdm(as_completed(future_to_file), total=len(future_to_file), desc="Submitting files"):
-                file_path = future_to_file[future]
+        # Opt-in asyncio/httpx pipeline: one multiplexed client instead of
+        # blocking threads. The sync path below stays the default because it
+        # also carries bulk signed URLs and sha256 dedup.
+        if self.use_async and aio is not None and aio.httpx is not None:
+            uploaded = aio.run_submit_all(self.base_url, self.job_id, self.id_token,
+                                          self.input_files,
+                                          lambda path: _mime_for_suffix(path.suffix.lower()),
+                                          concurrency=self.concurrency,
+                                          timeout=self._timeout)
+            job_params['files'].extend(uploaded)
+            logger.info(f"Uploaded {len(uploaded)}/{len(self.input_files)} files (async pipeline)")
+            return job_params
+
+        # One round-trip for all signed URLs when the server supports it; the
+        # executor then only performs PUTs.
+        specs = [{"fileName": f.name, "fileType": _mime_for_suffix(f.suffix.lower())}
+                 for f in self.input_files]
+        url_by_name = self.get_signed_urls_bulk(specs) if specs else {}
+
+        def submit(file_path: Path) -> str:
+            signed_url = url_by_name.get(file_path.name)
+            if signed_url:
+                return self._put_file(file_path, signed_url, _mime_for_suffix(file_path.suffix.lower()))
+            return self.submit_file(file_path)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            future_to_name = {executor.submit(submit, file): file.name for file in self.input_files}
+            uploaded_names = set()
+            completed = 0
+            for future in tqdm.tqdm(as_completed(future_to_name), total=len(future_to_name),
+                                    desc="Submitting files", disable=not _USE_TQDM):
+                name = future_to_name[future]
                 try:
-                    target = future.result()
-                    job_params['files'].append(target)
-                    logger.info(f"Uploaded {file_path.name} as {target}")
+                    uploaded_names.add(future.result())
+                    logger.debug(f"Uploaded {name}")
                 except Exception as e:
-                    logger.error(f"Failed to upload {file_path.name}: {e}")
+                    logger.error(f"Failed to upload {name}: {e}")
+                completed += 1
+                if completed % _LOG_EVERY == 0:
+                    logger.info(f"Uploaded {completed}/{len(future_to_name)} files")
+        logger.info(f"Uploaded {len(uploaded_names)}/{len(future_to_name)} files")
+        # Record names in input order, not completion order, so the job spec is
+        # reproducible across runs.
+        job_params['files'].extend(f.name for f in self.input_files if f.name in uploaded_names)
         return job_params
 
-    def submit_job(self, job_parameters: dict) -> Path:
+    def submit_job(self, job_parameters: dict) -> str:
         """
-        Create and upload a YAML job file containing the job parameters.
+        Serialize and upload the YAML job file containing the job parameters.
 
-        The job file is saved locally with the filename "{job_id}.yaml" and then uploaded to the server.
+        The job spec is uploaded as "{job_id}.yaml" straight from memory; nothing
+        is written to the local working directory.
 
         Args:
             job_parameters (dict): A dictionary containing the job parameters.
 
         Returns:
-            Path: The local path to the YAML job file that was created and submitted.
+            str: The name of the YAML job file that was submitted.
+
+        Raises:
+            requests.HTTPError: If the upload request fails.
         """
-        job_file = Path(f"{self.job_id}.yaml")
-        job_file.write_text(yaml.safe_dump(job_parameters, default_flow_style=False))
-        self.submit_file(job_file)
-        return job_file
+        file_name = f"{self.job_id}.yaml"
+        body = gzip.compress(
+            yaml.dump(job_parameters, Dumper=_YamlDumper, default_flow_style=False).encode(),
+            compresslevel=6,
+        )
+        signed_url = self.get_signed_url(file_name, "application/x-yaml")
+        response = self.session.put(
+            signed_url,
+            data=body,
+            headers={
+                "Content-Type": "application/x-yaml",
+                "Content-Encoding": "gzip",
+                "Content-Length": str(len(body)),
+            },
+            timeout=self._timeout,
+        )
+        response.raise_for_status()
+        return file_name
 
     def get_signed_url_download(self, file_name: str) -> str:
         """
@@ -308,50 +640,176 @@ class VoiceHarborClient:
             requests.HTTPError: If the HTTP request returned an unsuccessful status code.
         """
         endpoint = f"{self.base_url}/api/jobs/{self.job_id}/files/download-url"
-        headers = {"Authorization": self.id_token} if self.id_token else {}
         payload = {"fileName": file_name}
-        response = self.session.post(endpoint, json=payload, headers=headers)
+        response = self.session.post(endpoint, json=payload, headers=self._auth_headers, timeout=self._timeout)
         response.raise_for_status()
-        data = response.json()
-        logger.info(f"Download signed URL response: {data}")
+        data = _json_loads(response.content)
+        logger.debug(f"Download signed URL response: {data}")
         return data["signedUrl"]
 
-    def wait_for_file(self, file_name: str, timeout: int = 600, interval: int = 10) -> bool:
+    def wait_for_file(self, file_name: str, timeout: int = 600, min_interval: float = 2,
+                      max_interval: float = 30, rate: float = 1.5) -> bool:
         """
         Poll the server to check if a file is available.
 
         This method repeatedly checks whether the specified file is finalized until the timeout
-        is reached or the file is confirmed available.
+        is reached or the file is confirmed available. The delay between polls grows
+        exponentially (with uniform jitter) from min_interval up to max_interval, so
+        long-running files generate far fewer requests than fixed-interval polling.
 
         Args:
             file_name (str): The name of the file to check.
             timeout (int, optional): Maximum time in seconds to wait. Defaults to 600.
-            interval (int, optional): Time in seconds between each poll. Defaults to 10.
+            min_interval (float, optional): Initial delay in seconds between polls. Defaults to 2.
+            max_interval (float, optional): Upper bound on the delay between polls. Defaults to 30.
+            rate (float, optional): Multiplicative backoff factor applied after each negative poll.
+                Defaults to 1.5.
 
         Returns:
             bool: True if the file is available before the timeout; otherwise, False.
         """
         finalized_endpoint = f"{self.base_url}/api/jobs/{self.job_id}/files/finalized"
-        headers = {"Authorization": self.id_token} if self.id_token else {}
+        # Serialize the payload once: the loop may run hundreds of iterations and
+        # the body never changes.
+        body = json.dumps({"fileName": file_name}).encode()
         start_time = time.time()
+        delay = min_interval
+        had_error = False
         while time.time() - start_time < timeout:
             try:
-                payload = {"fileName": file_name}
-                response = self.session.post(finalized_endpoint, json=payload, headers=headers)
+                response = self.session.post(finalized_endpoint, data=body, headers=self._json_headers, timeout=self._timeout)
                 response.raise_for_status()
-                data = response.json()
+                if had_error:
+                    # The server is reachable again; start backing off from scratch.
+                    delay = min_interval
+                    had_error = False
+                data = _json_loads(response.content)
                 if data.get("exists", False):
-                    logger.info(f"File {file_name} finalized (endpoint returned true).")
+                    logger.debug(f"File {file_name} finalized (endpoint returned true).")
                     return True
                 else:
-                    logger.info(f"File {file_name} does not exist yet.")
+                    logger.debug(f"File {file_name} does not exist yet.")
             except Exception as e:
-                logger.info(f"Error checking file existence for {file_name}: {e}")
-            time.sleep(interval)
+                logger.debug(f"Error checking file existence for {file_name}: {e}")
+                had_error = True
+            delay = min(max_interval, delay * rate)
+            time.sleep(random.uniform(min_interval, delay))
         logger.error(f"Timeout reached: {file_name} not available after {timeout} seconds.")
         return False
 
-    def download_file(self, file_name: str, dest_dir: Path, timeout: int = 600, interval: int = 10) -> Path:
+    def wait_for_files_long_poll(self, pending: set, timeout: int = 600, hang: int = 55):
+        """
+        Wait for multiple files with a single hanging GET instead of one poll loop per file.
+
+        The server holds GET /api/jobs/{job_id}/files/wait open for up to 'hang' seconds and
+        answers as soon as any of the requested files finalizes, so N waiters collapse into
+        one request at a time regardless of how many files are outstanding.
+
+        Args:
+            pending (set): Mutable set of file names still being waited on; finalized names
+                are removed as they are yielded.
+            timeout (int, optional): Maximum time in seconds to wait overall. Defaults to 600.
+            hang (int, optional): Server-agreed maximum hold time per request. Defaults to 55.
+
+        Yields:
+            str: Each file name, as the server reports it finalized.
+
+        Raises:
+            requests.HTTPError: If the wait endpoint is unavailable (e.g. 404 on servers
+                without long-poll support).
+        """
+        endpoint = f"{self.base_url}/api/jobs/{self.job_id}/files/wait"
+        start_time = time.time()
+        while pending and time.time() - start_time < timeout:
+            request_started = time.time()
+            response = self.session.get(
+                endpoint,
+                params={"names": ",".join(sorted(pending)), "hang": hang},
+                headers=self._auth_headers,
+                timeout=hang + 5,
+            )
+            response.raise_for_status()
+            data = _json_loads(response.content)
+            progressed = False
+            for name in data.get("finalized", []):
+                if name in pending:
+                    pending.discard(name)
+                    logger.debug(f"File {name} finalized (long-poll).")
+                    progressed = True
+                    yield name
+            # A server that answers immediately with nothing new must not turn
+            # this into a zero-delay busy loop; keep a floor between requests.
+            if not progressed and time.time() - request_started < 1:
+                time.sleep(1)
+        for name in sorted(pending):
+            logger.error(f"Timeout reached: {name} not available after {timeout} seconds.")
+
+    def serve_webhook(self, port: int = 0, callback_host: str = None):
+        """
+        Start a local callback server and subscribe it to finalized-file notifications.
+
+        The server accepts POST requests carrying a JSON body with a 'fileName' key and sets
+        a per-file threading.Event, which wait_for_file_webhook blocks on. The callback URL
+        is registered with the Voice Harbor service via /api/jobs/{job_id}/subscribe, so no
+        polling traffic is generated at all while files are processing.
+
+        Args:
+            port (int, optional): Local port to listen on; 0 picks a free port. Defaults to 0.
+            callback_host (str, optional): Externally reachable host name to advertise in the
+                callback URL. Defaults to this machine's resolved address.
+
+        Returns:
+            http.server.ThreadingHTTPServer: The running server; call shutdown() when done.
+
+        Raises:
+            requests.HTTPError: If the subscription request fails.
+        """
+        events = self._webhook_events
+
+        class _CallbackHandler(http.server.BaseHTTPRequestHandler):
+            def do_POST(handler):
+                length = int(handler.headers.get("Content-Length", 0))
+                try:
+                    payload = json.loads(handler.rfile.read(length) or b"{}")
+                except ValueError:
+                    handler.send_response(400)
+                    handler.end_headers()
+                    return
+                name = payload.get("fileName")
+                if name:
+                    events.setdefault(name, threading.Event()).set()
+                handler.send_response(204)
+                handler.end_headers()
+
+            def log_message(handler, format, *args):
+                logger.debug("Webhook: " + format % args)
+
+        server = http.server.ThreadingHTTPServer(("", port), _CallbackHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host = callback_host or socket.gethostbyname(socket.gethostname())
+        callback_url = f"http://{host}:{server.server_address[1]}/"
+        endpoint = f"{self.base_url}/api/jobs/{self.job_id}/subscribe"
+        response = self.session.post(endpoint, json={"callbackUrl": callback_url}, headers=self._auth_headers, timeout=self._timeout)
+        response.raise_for_status()
+        logger.info(f"Subscribed webhook {callback_url} for job {self.job_id}")
+        return server
+
+    def wait_for_file_webhook(self, file_name: str, timeout: int = 600) -> bool:
+        """
+        Block until the webhook server (see serve_webhook) reports a file as finalized.
+
+        Args:
+            file_name (str): The name of the file to wait for.
+            timeout (int, optional): Maximum time in seconds to wait. Defaults to 600.
+
+        Returns:
+            bool: True if the notification arrived before the timeout; otherwise, False.
+        """
+        event = self._webhook_events.setdefault(file_name, threading.Event())
+        return event.wait(timeout)
+
+    def download_file(self, file_name: str, dest_dir: Path, timeout: int = 600, min_interval: float = 2,
+                      max_interval: float = 30, rate: float = 1.5) -> Path:
         """
         Wait for a file to become available and then download it.
 
@@ -361,7 +819,9 @@ class VoiceHarborClient:
             file_name (str): The name of the file to download.
             dest_dir (Path): The destination directory where the file will be saved.
             timeout (int, optional): Maximum time in seconds to wait for the file. Defaults to 600.
-            interval (int, optional): Polling interval in seconds. Defaults to 10.
+            min_interval (float, optional): Initial polling delay in seconds. Defaults to 2.
+            max_interval (float, optional): Maximum polling delay in seconds. Defaults to 30.
+            rate (float, optional): Backoff factor between polls. Defaults to 1.5.
 
         Returns:
             Path: The full local path to the downloaded file.
@@ -370,19 +830,41 @@ class VoiceHarborClient:
             Exception: If the file does not become available within the timeout period.
             requests.HTTPError: If the file download request fails.
         """
-        if not self.wait_for_file(file_name, timeout, interval):
+        if not self.wait_for_file(file_name, timeout, min_interval, max_interval, rate):
             raise Exception(f"File {file_name} not available after waiting {timeout} seconds.")
+        return self._fetch_file(file_name, dest_dir)
+
+    def _fetch_file(self, file_name: str, dest_dir: Path) -> Path:
+        """
+        Download an already-finalized file via its signed URL.
+
+        Args:
+            file_name (str): The name of the file to download.
+            dest_dir (Path): The destination directory where the file will be saved.
+
+        Returns:
+            Path: The full local path to the downloaded file.
+
+        Raises:
+            requests.HTTPError: If the file download request fails.
+        """
         signed_url = self.get_signed_url_download(file_name)
-        response = self.session.get(signed_url)
-        response.raise_for_status()
         dest_path = dest_dir / file_name
         dest_path.parent.mkdir(parents=True, exist_ok=True)
-        with dest_path.open("wb") as f:
-            f.write(response.content)
-        logger.info(f"Downloaded {file_name} to {dest_path}")
+        # Stream to disk so memory stays O(chunk size) instead of O(file size)
+        # per concurrent download. iter_content (unlike reading response.raw)
+        # applies Content-Encoding decoding, so gzip/zstd transcripts land on
+        # disk decompressed.
+        with self.session.get(signed_url, stream=True, timeout=(self._timeout[0], _STALL_TIMEOUT)) as response:
+            response.raise_for_status()
+            with dest_path.open("wb") as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
+        logger.debug(f"Downloaded {file_name} to {dest_path}")
         return dest_path
 
-    def download_results(self, output_dir: str = "./results", timeout: int = 600, interval: int = 10, yaml: str = None) -> dict:
+    def download_results(self, output_dir: str = "./results", timeout: int = 600, min_interval: float = 2,
+                         max_interval: float = 30, rate: float = 1.5, yaml: str = None) -> dict:
         """
         Download processed result files in parallel.
 
@@ -392,7 +874,9 @@ class VoiceHarborClient:
         Args:
             output_dir (str, optional): Directory where the downloaded files will be stored. Defaults to "./results".
             timeout (int, optional): Maximum time in seconds to wait for each file. Defaults to 600.
-            interval (int, optional): Polling interval in seconds for checking file availability. Defaults to 10.
+            min_interval (float, optional): Initial polling delay in seconds. Defaults to 2.
+            max_interval (float, optional): Maximum polling delay in seconds. Defaults to 30.
+            rate (float, optional): Backoff factor between polls. Defaults to 1.5.
             yaml (str, optional): Path to a YAML file containing a 'files' list. Defaults to None.
 
         Returns:
@@ -408,7 +892,7 @@ class VoiceHarborClient:
             # Use a local alias for the YAML module to avoid conflict with the argument name.
             import yaml as yaml_module
             try:
-                job_data = yaml_module.safe_load(job_yaml_file.read_text())
+                job_data = yaml_module.load(job_yaml_file.read_text(), Loader=_YamlLoader)
                 file_names = job_data.get("files", [])
                 logger.info(f"Loaded {len(file_names)} file names from YAML file {yaml}")
             except Exception as e:
@@ -417,15 +901,69 @@ class VoiceHarborClient:
         else:
             file_names = [file.name for file in self.input_files]
 
+        # Skip pairs already present locally, so restarting a partially completed
+        # job costs a stat() per file instead of a poll loop and re-download.
+        remaining = []
+        for file_name in file_names:
+            file_dest = output_dir_path / file_name
+            json_dest = output_dir_path / f"{Path(file_name).stem}.json"
+            if file_dest.is_file() and json_dest.is_file():
+                logger.debug(f"Skipping {file_name}: results already present in {output_dir}.")
+                downloaded[file_name] = {"file": str(file_dest), "json": str(json_dest)}
+            else:
+                remaining.append(file_name)
+        file_names = remaining
+        if not file_names:
+            return downloaded
+
+        # Prefer a single multiplexed long-poll waiter; servers without the wait
+        # endpoint fall back to the per-file polling path below.
+        json_name_for = {name: f"{Path(name).stem}.json" for name in file_names}
+        try:
+            pending = set(file_names) | set(json_name_for.values())
+            fetched = {}
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                futures = {}
+                # Submit a download future only once the server says the file is ready,
+                # instead of parking one waiter thread per file.
+                for ready_name in self.wait_for_files_long_poll(pending, timeout):
+                    futures[executor.submit(self._fetch_file, ready_name, output_dir_path)] = ready_name
+                for future in tqdm.tqdm(as_completed(futures), total=len(futures),
+                                        desc="Downloading files", disable=not _USE_TQDM):
+                    name = futures[future]
+                    try:
+                        fetched[name] = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to download {name}: {e}")
+            for file_name, json_file_name in json_name_for.items():
+                if file_name in fetched and json_file_name in fetched:
+                    downloaded[file_name] = {
+                        "file": str(fetched[file_name]),
+                        "json": str(fetched[json_file_name])
+                    }
+            return downloaded
+        except requests.RequestException as e:
+            # Covers 404/405 from servers without the endpoint as well as
+            # connection resets and read timeouts on the hanging GET (proxies
+            # and NATs routinely kill idle long-polls); per-file polling
+            # tolerates all of those.
+            logger.info(f"Long-poll wait failed ({e}); falling back to per-file polling.")
+
         def download_pair(file_name: str) -> dict:
             base_name = Path(file_name).stem
             json_file_name = f"{base_name}.json"
             pair = {}
             try:
-                # Download the main file.
-                downloaded_file = self.download_file(file_name, output_dir_path, timeout, interval)
-                # Download the corresponding JSON.
-                downloaded_json = self.download_file(json_file_name, output_dir_path, timeout, interval)
+                # The server writes the JSON transcript alongside the audio result, so one
+                # wait covers the pair; the JSON download then succeeds on its first poll.
+                if not self.wait_for_file(file_name, timeout, min_interval, max_interval, rate):
+                    raise Exception(f"File {file_name} not available after waiting {timeout} seconds.")
+                with ThreadPoolExecutor(max_workers=2) as pair_executor:
+                    file_future = pair_executor.submit(self._fetch_file, file_name, output_dir_path)
+                    json_future = pair_executor.submit(self.download_file, json_file_name, output_dir_path,
+                                                       timeout, min_interval, max_interval, rate)
+                    downloaded_file = file_future.result()
+                    downloaded_json = json_future.result()
                 pair[file_name] = {
                     "file": str(downloaded_file),
                     "json": str(downloaded_json)
@@ -435,9 +973,10 @@ class VoiceHarborClient:
             return pair
 
         # Use ThreadPoolExecutor to download each file pair concurrently.
-        with ThreadPoolExecutor(max_workers=5) as executor:
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
             futures = {executor.submit(download_pair, file_name): file_name for file_name in file_names}
-            for future in tqdm.tqdm(as_completed(futures), total=len(futures), desc="Downloading files"):
+            for future in tqdm.tqdm(as_completed(futures), total=len(futures),
+                                        desc="Downloading files", disable=not _USE_TQDM):
                 result = future.result()
                 downloaded.update(result)
         return downloaded
@@ -460,12 +999,32 @@ def main():
     parser.add_argument("--inputs-dir", type=str, required=True, help="Directory containing input files")
     parser.add_argument("--output-dir", type=str, default="./results", help="Directory to save the output files")
     parser.add_argument("--timeout", type=int, default=600, help="Timeout for waiting for files (in seconds)")
-    parser.add_argument("--interval", type=int, default=10, help="Polling interval (in seconds)")
+    parser.add_argument("--interval", type=int, default=None,
+                        help="Deprecated: fixed polling interval (in seconds); sets both --min-interval and --max-interval")
+    parser.add_argument("--min-interval", type=float, default=2,
+                        help="Initial polling delay (in seconds) before backoff")
+    parser.add_argument("--max-interval", type=float, default=30,
+                        help="Maximum polling delay (in seconds) after backoff")
+    parser.add_argument("--backoff-rate", type=float, default=1.5,
+                        help="Multiplicative backoff factor applied between polls")
+    parser.add_argument("--connect-timeout", type=float, default=_TIMEOUT[0],
+                        help="Connect timeout for API requests (in seconds)")
+    parser.add_argument("--read-timeout", type=float, default=_TIMEOUT[1],
+                        help="Read timeout for API requests (in seconds)")
+    parser.add_argument("--concurrency", type=int, default=min(32, (os.cpu_count() or 4) * 4),
+                        help="Number of parallel transfers; mind server-side rate limits when raising it")
+    parser.add_argument("--async-upload", action="store_true",
+                        help="Upload via the asyncio/httpx pipeline (requires the 'async' extra)")
     parser.add_argument("--agents", nargs="+", required=False, help="List of agents to use for advanced model")
     parser.add_argument("--prefix", type=str, default="", help="Optional prefix to include in the job parameters")
 
     args = parser.parse_args()
 
+    # Backward compatibility: a fixed --interval maps to a constant polling delay.
+    if args.interval is not None:
+        args.min_interval = args.interval
+        args.max_interval = args.interval
+
     # Create a new job on the server using the class method.
     job_id = VoiceHarborClient.create_job(args.base_url, args.token)
     logger.info(f"Job created on server with id: {job_id}")
@@ -474,7 +1033,10 @@ def main():
         base_url=args.base_url,
         job_id=job_id,
         token=args.token,
-        inputs_dir=args.inputs_dir
+        inputs_dir=args.inputs_dir,
+        request_timeout=(args.connect_timeout, args.read_timeout),
+        concurrency=args.concurrency,
+        use_async=args.async_upload
     )
 
     # Build job parameters, include only provided options.
@@ -506,7 +1068,9 @@ def main():
     downloaded_files = client.download_results(
         output_dir=args.output_dir,
         timeout=args.timeout,
-        interval=args.interval
+        min_interval=args.min_interval,
+        max_interval=args.max_interval,
+        rate=args.backoff_rate
     )
     logger.info(f"Downloaded result files: {downloaded_files}")
 
@@ -12,9 +12,13 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests",
-        "pyyaml",
+        "pyyaml>=6",
         "tqdm",
+        "orjson",
     ],
+    extras_require={
+        "async": ["httpx[http2]", "aiofiles"],
+    },
     entry_points={
         'console_scripts': [
             'voice-harbor-client=voice_harbor_client.python.client:main',